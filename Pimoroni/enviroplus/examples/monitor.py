@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 
-import colorsys
+import bisect
+import math
+import queue
 import sys
+import threading
 import time
 
 import st7735
@@ -14,10 +17,13 @@ except ImportError:
     import ltr559
 
 import logging
+from collections import deque
+from functools import lru_cache, partial
 from subprocess import PIPE, Popen
 
 from bme280 import BME280
 from fonts.ttf import RobotoMedium as UserFont
+import numpy
 from PIL import Image, ImageDraw, ImageFont
 from pms5003 import PMS5003
 from pms5003 import ReadTimeoutError as pmsReadTimeoutError
@@ -36,32 +42,82 @@ Press Ctrl+C to exit!
 
 """)
 
+# Caches kept for one paging delay, so flipping between related modes reuses a reading
+_gas_cache = {"t": 0.0, "v": None}
+_pms_cache = {"t": 0.0, "v": None}
+
+# Names and units of the variables shown on the display
+variables = (
+    "temperature", "pressure", "humidity", "light",
+    "oxidised", "reduced", "nh3", "pm1", "pm25", "pm10"
+)
+units = (
+    "C", "hPa", "%", "Lux", "kO", "kO", "kO",
+    "ug/m3", "ug/m3", "ug/m3"
+)
+# Four-letter names used in the on-screen and logged messages
+short_names = {v: v[:4] for v in variables}
+# Define your own warning limits, in ascending order
+limits = (
+    (4, 18, 28, 35),
+    (250, 650, 1013.25, 1015),
+    (20, 30, 60, 70),
+    (-1, -1, 30000, 100000),
+    (-1, -1, 40, 50),
+    (-1, -1, 450, 550),
+    (-1, -1, 200, 300),
+    (-1, -1, 50, 100),
+    (-1, -1, 50, 100),
+    (-1, -1, 50, 100)
+)
+# RGB palette for values on the combined screen
+palette = (
+    (0, 0, 255),    # Dangerously Low
+    (0, 255, 255),  # Low
+    (0, 255, 0),    # Normal
+    (255, 255, 0),  # High
+    (255, 0, 0)     # Dangerously High
+)
+
 def setup_sensors():
-    global bme280, pms5003
+    global bme280, pms5003, cpu_temp_file
     # BME280 temperature/pressure/humidity sensor
     bme280 = BME280()
     # PMS5003 particulate sensor
     pms5003 = PMS5003()
+    # Kernel thermal zone for the CPU temperature, read in millidegrees
+    try:
+        cpu_temp_file = open("/sys/class/thermal/thermal_zone0/temp")
+    except OSError:
+        cpu_temp_file = None
     time.sleep(1.0)
 
 def setup_display():
-    global st7735, WIDTH, HEIGHT, img, draw, font, smallfont, x_offset, y_offset, top_pos
+    global st7735, WIDTH, HEIGHT, img, draw, font, smallfont, x_offset, y_offset, top_pos, frame_queue, rotation
+    global BLACK_BG, WHITE_BG
     # Create ST7735 LCD display class
+    rotation = 270
     st7735 = st7735.ST7735(
         port=0,
         cs=1,
         dc="GPIO9",
         backlight="GPIO12",
-        rotation=270,
-        spi_speed_hz=10000000
+        rotation=rotation,
+        spi_speed_hz=32000000
     )
     # Initialize display
     st7735.begin()
+    # Push frames over SPI from a background thread so sensor reads can overlap
+    frame_queue = queue.Queue(maxsize=1)
+    threading.Thread(target=display_worker, daemon=True).start()
     WIDTH = st7735.width
     HEIGHT = st7735.height
     # Set up canvas and font
     img = Image.new("RGB", (WIDTH, HEIGHT), color=(0, 0, 0))
     draw = ImageDraw.Draw(img)
+    # Solid backgrounds to clear the canvas with a single paste
+    BLACK_BG = Image.new("RGB", (WIDTH, HEIGHT), color=(0, 0, 0))
+    WHITE_BG = Image.new("RGB", (WIDTH, HEIGHT), color=(255, 255, 255))
     font_size_small = 10
     font_size_large = 20
     font = ImageFont.truetype(UserFont, font_size_large)
@@ -72,244 +128,319 @@ def setup_display():
     top_pos = 25
 
 def setup_variables():
-    global variables, units, limits, palette, values
+    global values, text_labels, cell_positions
     # Create a values dict to store the data
-    variables = [
-        "temperature", "pressure", "humidity", "light",
-        "oxidised", "reduced", "nh3", "pm1", "pm25", "pm10"
-    ]
-    units = [
-        "C", "hPa", "%", "Lux", "kO", "kO", "kO",
-        "ug/m3", "ug/m3", "ug/m3"
-    ]
-    # Define your own warning limits
-    limits = [
-        [4, 18, 28, 35],
-        [250, 650, 1013.25, 1015],
-        [20, 30, 60, 70],
-        [-1, -1, 30000, 100000],
-        [-1, -1, 40, 50],
-        [-1, -1, 450, 550],
-        [-1, -1, 200, 300],
-        [-1, -1, 50, 100],
-        [-1, -1, 50, 100],
-        [-1, -1, 50, 100]
-    ]
-    # RGB palette for values on the combined screen
-    palette = [
-        (0, 0, 255),    # Dangerously Low
-        (0, 255, 255),  # Low
-        (0, 255, 0),    # Normal
-        (255, 255, 0),  # High
-        (255, 0, 0)     # Dangerously High
-    ]
-    values = {}
+    values = {v: deque([1.0] * WIDTH, maxlen=WIDTH) for v in variables}
+    # Pre-render the static "name: " part of each message for the graph screen
+    text_labels = {
+        v: render_label(f"{short_names[v]}: ", font, (0, 0, 0), (255, 255, 255))
+        for v in variables
+    }
+    # Top-left corner of each variable's cell on the combined screen
+    column_count = 2
+    row_count = (len(variables) / column_count)
+    cell_positions = tuple(
+        (int(x_offset + ((WIDTH // column_count) * (i // row_count))),
+         int(y_offset + ((HEIGHT / row_count) * (i % row_count))))
+        for i in range(len(variables))
+    )
 
 def setup_state():
-    global mode, last_page, delay, cpu_temps, factor
+    global mode, last_page, delay, cpu_temps, cpu_temp_sum, cpu_temp_time, factor
     # Initialize mode and timing variables
     mode = 0
     last_page = time.time()
     delay = 0.5
-    # Initialize CPU temperature smoothing
-    cpu_temps = [0.0] * 5
+    # Initialize CPU temperature smoothing with a real reading so the average is right from the start
+    cpu_temp = get_cpu_temperature()
+    cpu_temps = deque([cpu_temp] * 5, maxlen=5)
+    cpu_temp_sum = cpu_temp * len(cpu_temps)
+    cpu_temp_time = time.monotonic()
     factor = 2.25
 
+def setup_handlers():
+    global HANDLERS
+    # Reader for each variable's graph screen, in the order of variables
+    readers = (
+        read_compensated_temperature,
+        bme280.get_pressure,
+        bme280.get_humidity,
+        read_light,
+        lambda: cached_gas().oxidising / 1000,
+        lambda: cached_gas().reducing / 1000,
+        lambda: cached_gas().nh3 / 1000,
+        partial(read_pm, 1.0),
+        partial(read_pm, 2.5),
+        partial(read_pm, 10),
+    )
+    # The graph screen has room for the degree sign on the temperature unit
+    graph_units = ("°C",) + units[1:]
+    # Mode handlers, indexed by mode, with the combined screen last
+    HANDLERS = tuple(
+        partial(handle_variable_mode, variable, unit, reader)
+        for variable, unit, reader in zip(variables, graph_units, readers)
+    ) + (handle_display_everything_mode,)
+
 def setup():
     setup_sensors()
     setup_display()
     setup_variables()
     setup_state()
+    setup_handlers()
+
+
+# Converts a frame to big-endian RGB565 pixels in the panel's native orientation
+def frame_to_rgb565(frame):
+    rgb = numpy.asarray(frame).astype(numpy.uint16)
+    colour = ((rgb[..., 0] & 0xF8) << 8) | ((rgb[..., 1] & 0xFC) << 3) | (rgb[..., 2] >> 3)
+    return numpy.rot90(colour, rotation // 90).astype(">u2")
+
+
+# Sends queued frames to the LCD, only rewriting the panel columns that changed
+def display_worker():
+    previous = None
+    while True:
+        frame = frame_queue.get()
+        try:
+            pixels = frame_to_rgb565(frame)
+            if previous is None:
+                changed = numpy.arange(pixels.shape[1])
+            else:
+                changed = numpy.flatnonzero(numpy.any(pixels != previous, axis=0))
+            # Split the changed columns into contiguous windows
+            for window in numpy.split(changed, numpy.flatnonzero(numpy.diff(changed) > 1) + 1):
+                if len(window) == 0:
+                    continue
+                start, end = int(window[0]), int(window[-1])
+                st7735.set_window(start, 0, end, pixels.shape[0] - 1)
+                data = pixels[:, start:end + 1].tobytes()
+                for i in range(0, len(data), 4096):
+                    st7735.data(data[i:i + 4096])
+        except Exception:
+            logging.exception("Failed to update the LCD")
+            # The panel may hold a partial frame, so send the next one in full
+            previous = None
+        else:
+            previous = pixels
+
+
+# Queues a copy of the canvas for display, replacing any frame not yet sent
+def show_frame():
+    try:
+        frame_queue.get_nowait()
+    except queue.Empty:
+        pass
+    frame_queue.put_nowait(img.copy())
+
+
+# Draws a piece of text onto its own small image so it can be pasted each frame
+def render_label(text, label_font, fill, background):
+    ascent, descent = label_font.getmetrics()
+    label = Image.new("RGB", (math.ceil(label_font.getlength(text)), ascent + descent), background)
+    ImageDraw.Draw(label).text((0, 0), text, font=label_font, fill=fill)
+    return label
+
+
+# Renders one cell of the combined screen, reusing it while the reading is unchanged
+@lru_cache(maxsize=256)
+def render_cell(message, rgb):
+    return render_label(message, smallfont, rgb, (0, 0, 0))
+
+
+# Vectorised colorsys.hsv_to_rgb(h, 1.0, 1.0) over an array of hues
+def hues_to_rgb(hues):
+    h6 = hues * 6.0
+    i = h6.astype(numpy.int32) % 6
+    f = h6 - numpy.floor(h6)
+    q = 1.0 - f
+    r = numpy.choose(i, (1.0, q, 0.0, 0.0, f, 1.0))
+    g = numpy.choose(i, (f, 1.0, 1.0, q, 0.0, 0.0))
+    b = numpy.choose(i, (0.0, 0.0, f, 1.0, 1.0, q))
+    return numpy.stack((r, g, b), axis=-1)
 
 
 # Displays data and text on the 0.96" LCD
 def display_text(variable, data, unit):
     # Maintain length of list
-    values[variable] = values[variable][1:] + [data]
+    values[variable].append(data)
     # Scale the values for the variable between 0 and 1
-    vmin = min(values[variable])
-    vmax = max(values[variable])
-    colours = [(v - vmin + 1) / (vmax - vmin + 1) for v in values[variable]]
+    samples = numpy.fromiter(values[variable], dtype=numpy.float32, count=len(values[variable]))
+    vmin = samples.min()
+    vmax = samples.max()
+    colours = (samples - vmin + 1) / (vmax - vmin + 1)
     # Format the variable name and value
-    message = f"{variable[:4]}: {data:.1f} {unit}"
-    logging.info(message)
-    draw.rectangle((0, 0, WIDTH, HEIGHT), (255, 255, 255))
-    for i in range(len(colours)):
-        # Convert the values to colours from red to blue
-        colour = (1.0 - colours[i]) * 0.6
-        r, g, b = [int(x * 255.0) for x in colorsys.hsv_to_rgb(colour, 1.0, 1.0)]
-        # Draw a 1-pixel wide rectangle of colour
-        draw.rectangle((i, top_pos, i + 1, HEIGHT), (r, g, b))
-        # Draw a line graph in black
-        line_y = HEIGHT - (top_pos + (colours[i] * (HEIGHT - top_pos))) + top_pos
-        draw.rectangle((i, line_y, i + 1, line_y + 1), (0, 0, 0))
-    # Write the text at the top in black
-    draw.text((0, 0), message, font=font, fill=(0, 0, 0))
-    st7735.display(img)
+    value_text = f"{data:.1f} {unit}"
+    logging.info(f"{short_names[variable]}: {value_text}")
+    img.paste(WHITE_BG, (0, 0))
+    label = text_labels[variable]
+    img.paste(label, (0, 0))
+    # Convert the values to colours from red to blue, one column per value
+    graph_height = HEIGHT - top_pos
+    column_rgb = (hues_to_rgb((1.0 - colours) * 0.6) * 255.0).astype(numpy.uint8)
+    graph = numpy.repeat(column_rgb[numpy.newaxis], graph_height, axis=0)
+    # Draw a line graph in black, two pixels thick
+    columns = numpy.arange(len(colours))
+    line_y = (graph_height - colours * graph_height).astype(numpy.int32)
+    line_rows = numpy.clip((line_y, line_y + 1), 0, graph_height - 1)
+    graph[line_rows, columns] = 0
+    img.paste(Image.fromarray(graph), (0, top_pos))
+    # Write the value after the label at the top in black
+    draw.text((label.width, 0), value_text, font=font, fill=(0, 0, 0))
+    show_frame()
 
 
 # Saves the data to be used in the graphs later and prints to the log
 def save_data(idx, data):
     variable = variables[idx]
     # Maintain length of list
-    values[variable] = values[variable][1:] + [data]
+    values[variable].append(data)
     unit = units[idx]
-    message = f"{variable[:4]}: {data:.1f} {unit}"
+    message = f"{short_names[variable]}: {data:.1f} {unit}"
     logging.info(message)
 
 
 # Displays all the text on the 0.96" LCD
 def display_everything():
-    draw.rectangle((0, 0, WIDTH, HEIGHT), (0, 0, 0))
-    column_count = 2
-    row_count = (len(variables) / column_count)
-    for i in range(len(variables)):
-        variable = variables[i]
+    img.paste(BLACK_BG, (0, 0))
+    # Local aliases so the loop below doesn't look them up every cell
+    paste = img.paste
+    bisect_left = bisect.bisect_left
+    for variable, unit, lim, position in zip(variables, units, limits, cell_positions):
         data_value = values[variable][-1]
-        unit = units[i]
-        x = x_offset + ((WIDTH // column_count) * (i // row_count))
-        y = y_offset + ((HEIGHT / row_count) * (i % row_count))
-        message = f"{variable[:4]}: {data_value:.1f} {unit}"
-        lim = limits[i]
-        rgb = palette[0]
-        for j in range(len(lim)):
-            if data_value > lim[j]:
-                rgb = palette[j + 1]
-        draw.text((x, y), message, font=smallfont, fill=rgb)
-    st7735.display(img)
+        # Pick the colour from how many limits the value is above
+        rgb = palette[bisect_left(lim, data_value)]
+        paste(render_cell(f"{short_names[variable]}: {data_value:.1f} {unit}", rgb), position)
+    show_frame()
 
 
-# Get the temperature of the CPU for compensation
-def get_cpu_temperature():
+# Read the gas sensor, reusing the last reading if it is still fresh
+def cached_gas():
+    now = time.monotonic()
+    if _gas_cache["v"] is None or now - _gas_cache["t"] > delay:
+        _gas_cache["v"] = gas.read_all()
+        _gas_cache["t"] = now
+    return _gas_cache["v"]
+
+
+# Read the particulate sensor, reusing the last frame if it is still fresh
+def cached_pms():
+    now = time.monotonic()
+    if _pms_cache["v"] is None or now - _pms_cache["t"] > delay:
+        _pms_cache["v"] = pms5003.read()
+        _pms_cache["t"] = now
+    return _pms_cache["v"]
+
+
+# Get the temperature of the CPU from vcgencmd
+def read_vcgencmd_temperature():
     process = Popen(["vcgencmd", "measure_temp"], stdout=PIPE, universal_newlines=True)
     output, _error = process.communicate()
     return float(output[output.index("=") + 1:output.rindex("'")])
 
-def handle_temperature_mode():
-    unit = "°C"
-    cpu_temp = get_cpu_temperature()
-    # Smooth out with some averaging to decrease jitter
-    cpu_temps = cpu_temps[1:] + [cpu_temp]
-    avg_cpu_temp = sum(cpu_temps) / float(len(cpu_temps))
-    raw_temp = bme280.get_temperature()
-    data = raw_temp - ((avg_cpu_temp - raw_temp) / factor)
-    display_text(variables[0], data, unit)
-
-def handle_pressure_mode():
-    unit = "hPa"
-    data = bme280.get_pressure()
-    display_text(variables[1], data, unit)
-
-def handle_humidity_mode():
-    unit = "%"
-    data = bme280.get_humidity()
-    display_text(variables[2], data, unit)
-
-def handle_light_mode():
-    unit = "Lux"
+
+# Get the temperature of the CPU for compensation
+def get_cpu_temperature():
+    cpu_temp = None
+    if cpu_temp_file is not None:
+        try:
+            cpu_temp_file.seek(0)
+            cpu_temp = int(cpu_temp_file.read()) / 1000.0
+        except (OSError, ValueError):
+            logging.warning("Failed to read CPU temperature from sysfs")
+    if cpu_temp is None:
+        cpu_temp = read_vcgencmd_temperature()
+    return cpu_temp
+
+# Smooth out the CPU temperature with a running average to decrease jitter
+def get_avg_cpu_temperature():
+    global cpu_temp_sum, cpu_temp_time
+    # Only sample every 'delay' seconds so the average spans several distinct readings
+    now = time.monotonic()
+    if now - cpu_temp_time > delay:
+        cpu_temp = get_cpu_temperature()
+        cpu_temp_sum += cpu_temp - cpu_temps[0]
+        cpu_temps.append(cpu_temp)
+        cpu_temp_time = now
+    return cpu_temp_sum / len(cpu_temps)
+
+# Compensate the BME280 temperature for heat from the CPU
+def compensate_temperature(raw_temp):
+    avg_cpu_temp = get_avg_cpu_temperature()
+    return raw_temp - ((avg_cpu_temp - raw_temp) / factor)
+
+def read_compensated_temperature():
+    return compensate_temperature(bme280.get_temperature())
+
+# Read temperature, pressure and humidity from a single burst of the BME280 data registers
+def read_bme280():
+    bme280.update_sensor()
+    return bme280.temperature, bme280.pressure, bme280.humidity
+
+# Read the light level, ignoring it while something is covering the sensor
+def read_light():
     if proximity < 10:
-        data = ltr559.get_lux()
-    else:
-        data = 1
-    display_text(variables[3], data, unit)
-
-def handle_oxidised_mode():
-    unit = "kO"
-    data = gas.read_all()
-    data = data.oxidising / 1000
-    display_text(variables[4], data, unit)
-
-def handle_reduced_mode():
-    unit = "kO"
-    data = gas.read_all()
-    data = data.reducing / 1000
-    display_text(variables[5], data, unit)
-
-def handle_nh3_mode():
-    unit = "kO"
-    data = gas.read_all()
-    data = data.nh3 / 1000
-    display_text(variables[6], data, unit)
-
-def handle_pm1_mode():
-    unit = "ug/m3"
-    try:
-        data = pms5003.read()
-    except (SerialTimeoutError, pmsReadTimeoutError):
-        logging.warning("Failed to read PMS5003")
-    else:
-        data = float(data.pm_ug_per_m3(1.0))
-        display_text(variables[7], data, unit)
+        return ltr559.get_lux()
+    return 1
 
-def handle_pm25_mode():
-    unit = "ug/m3"
-    try:
-        data = pms5003.read()
-    except (SerialTimeoutError, pmsReadTimeoutError):
-        logging.warning("Failed to read PMS5003")
-    else:
-        data = float(data.pm_ug_per_m3(2.5))
-        display_text(variables[8], data, unit)
+# Read the concentration of one particle size from the PMS5003
+def read_pm(size):
+    return float(cached_pms().pm_ug_per_m3(size))
+
+# Read all three particle sizes from a single PMS5003 frame, shared with the
+# single PM screens through cached_pms() so flipping from pm10 reuses it
+def read_pms_all():
+    data = cached_pms()
+    return float(data.pm_ug_per_m3(1.0)), float(data.pm_ug_per_m3(2.5)), float(data.pm_ug_per_m3(10))
 
-def handle_pm10_mode():
-    unit = "ug/m3"
+# Shows a single variable, read through its reader, on the graph screen
+def handle_variable_mode(variable, unit, reader):
     try:
-        data = pms5003.read()
+        data = reader()
     except (SerialTimeoutError, pmsReadTimeoutError):
         logging.warning("Failed to read PMS5003")
     else:
-        data = float(data.pm_ug_per_m3(10))
-        display_text(variables[9], data, unit)
+        display_text(variable, data, unit)
 
 def handle_display_everything_mode():
-    cpu_temp = get_cpu_temperature()
-    # Smooth out with some averaging to decrease jitter
-    cpu_temps = cpu_temps[1:] + [cpu_temp]
-    avg_cpu_temp = sum(cpu_temps) / float(len(cpu_temps))
-    raw_temp = bme280.get_temperature()
-    raw_data = raw_temp - ((avg_cpu_temp - raw_temp) / factor)
-    save_data(0, raw_data)
-    display_everything()
-    raw_data = bme280.get_pressure()
-    save_data(1, raw_data)
-    display_everything()
-    raw_data = bme280.get_humidity()
-    save_data(2, raw_data)
-    if proximity < 10:
-        raw_data = ltr559.get_lux()
-    else:
-        raw_data = 1
-    save_data(3, raw_data)
-    display_everything()
+    raw_temp, pressure, humidity = read_bme280()
+    save_data(0, compensate_temperature(raw_temp))
+    save_data(1, pressure)
+    save_data(2, humidity)
+    save_data(3, read_light())
     gas_data = gas.read_all()
     save_data(4, gas_data.oxidising / 1000)
     save_data(5, gas_data.reducing / 1000)
     save_data(6, gas_data.nh3 / 1000)
-    display_everything()
-    pms_data = None
     try:
-        pms_data = pms5003.read()
+        pm1, pm25, pm10 = read_pms_all()
     except (SerialTimeoutError, pmsReadTimeoutError):
         logging.warning("Failed to read PMS5003")
     else:
-        save_data(7, float(pms_data.pm_ug_per_m3(1.0)))
-        save_data(8, float(pms_data.pm_ug_per_m3(2.5)))
-        save_data(9, float(pms_data.pm_ug_per_m3(10)))
-        display_everything()
+        save_data(7, pm1)
+        save_data(8, pm25)
+        save_data(9, pm10)
+    # Draw once all readings are in, keeping the previous PM values if the read failed
+    display_everything()
 
 def main_loop ():
     global mode, last_page, delay
     global proximity, lux
     global screen_on, dimmed, light_off_time, light_on_time
     global dim_delay, off_delay, on_delay
+    global tick, off_tick, dim_interval, next_tick, last_render
     
     screen_on = True
     dimmed = False
     light_off_time = None
     light_on_time = None
-    dim_delay = 2      # seconds to wait before dimming
-    off_delay = 4      # seconds to wait before turning off after dim
-    on_delay = 3       # seconds of light before turning back on
+    dim_delay = 2       # seconds to wait before dimming
+    off_delay = 4       # seconds to wait before turning off after dim
+    on_delay = 3        # seconds of light before turning back on
+    tick = 1 / 20       # seconds per loop iteration, so at most 20 Hz
+    off_tick = 0.2      # seconds per loop iteration while the screen is off
+    dim_interval = 0.5  # seconds between redraws while the screen is dimmed
+    next_tick = time.monotonic()
+    last_render = 0.0
 
     try:
         while True:
@@ -352,35 +483,23 @@ def main_loop ():
             # If the proximity crosses the threshold, toggle the mode
             if proximity > 1500 and time.time() - last_page > delay:
                 mode += 1
-                mode %= (len(variables) + 1)
+                mode %= len(HANDLERS)
                 last_page = time.time()
 
-            # Call the appropriate function based on the mode
-            match mode:
-
-                case 10:
-                    handle_display_everything_mode()
-                case 0:
-                    handle_temperature_mode()
-                case 1:
-                    handle_pressure_mode()
-                case 2:
-                    handle_humidity_mode()
-                case 3:
-                    handle_light_mode()
-                case 4:
-                    handle_oxidised_mode()
-                case 5:
-                    handle_reduced_mode()
-                case 6:
-                    handle_nh3_mode()
-                case 7:
-                    handle_pm1_mode()
-                case 8:
-                    handle_pm25_mode()
-                case 9:
-                    handle_pm10_mode()
-        
+            # Call the appropriate function based on the mode, but only while
+            # the screen can be seen and less often while it is dimmed
+            if screen_on and (not dimmed or now - last_render > dim_interval):
+                HANDLERS[mode]()
+                last_render = now
+
+            # Wait for the next tick so the loop doesn't spin the CPU
+            next_tick += tick if screen_on else off_tick
+            sleep_time = next_tick - time.monotonic()
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+            else:
+                # Running behind after a slow sensor read, so don't try to catch up
+                next_tick = time.monotonic()
 
     except KeyboardInterrupt:
         sys.exit(0)